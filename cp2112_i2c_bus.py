@@ -4,6 +4,67 @@ CP2112 I2C Bus Wrapper
 Provides a minimal I2C bus interface for CP2112 to work with Adafruit CircuitPython libraries
 """
 
+# Valid I2C 7-bit address range probed by scan() (0x08-0x77)
+_SCAN_ADDRESSES = range(0x08, 0x78)
+
+# Most data bytes one CP2112 Data Write Request HID report can carry
+_HID_WRITE_MAX = 61
+
+
+def _out_bytes(buffer, start=0, end=None):
+    """Return the bytes of ``buffer`` between two byte offsets.
+    
+    Any buffer-protocol object is addressed by byte, so multi-byte arrays
+    are sliced the same way as ``bytes``. The selected bytes are copied
+    once, into the ``bytes`` object the CP2112 device API requires; whole
+    ``bytes`` objects are returned as they are, without a copy.
+    
+    Args:
+        buffer: Bytes-like object.
+        start (int, optional): Start byte offset. Defaults to 0.
+        end (int or None, optional): One-past-end byte offset. If None,
+            runs to the end of ``buffer``. Defaults to None.
+    
+    Returns:
+        bytes: The selected bytes.
+    """
+    if start == 0 and end is None and type(buffer) is bytes:
+        return buffer
+    view = buffer if type(buffer) is memoryview else memoryview(buffer)
+    if view.itemsize != 1:
+        view = view.cast("B")
+    if start or end is not None:
+        # Slicing a memoryview does not copy
+        view = view[start:end]
+    return view.tobytes()
+
+
+def command_data_frame(commands, data=b""):
+    """Build one OLED controller I2C transfer of commands and display data.
+    
+    Uses the SSD1306/SH1106 I2C control byte protocol: every command
+    byte is preceded by a 0x80 control byte (Co=1, D/C=0), and the data
+    stream is introduced by a single 0x40 control byte (Co=0, D/C=1).
+    When there is no data, the commands are sent as one command stream
+    behind a 0x00 control byte instead.
+    
+    Args:
+        commands: Iterable of command byte values (0-255).
+        data (bytes-like, optional): Display data to write after the
+            commands. Defaults to empty.
+    
+    Returns:
+        bytes: The transfer, without the device address.
+    """
+    if not data:
+        return bytes((0x00, *commands))
+    frame = bytearray()
+    for command in commands:
+        frame += bytes((0x80, command))
+    frame.append(0x40)
+    frame += data
+    return bytes(frame)
+
 
 class CP2112I2CBus:
     """Minimal I2C bus wrapper for CP2112 to work with Adafruit libraries.
@@ -19,8 +80,50 @@ class CP2112I2CBus:
             cp2112_device: CP2112Device instance to wrap
         """
         self.device = cp2112_device
+        # Bound methods cached once; every I2C transfer goes through these.
+        self._dev_write = cp2112_device.write
+        self._dev_read = cp2112_device.read
+    
+    def _read_into(self, address, buffer, start=0, end=None):
+        """Read from an I2C device into ``buffer`` between two byte offsets.
+        
+        Any writable buffer-protocol object is addressed by byte, the same
+        way :func:`_out_bytes` addresses output buffers. The result of the
+        device's ``read`` is copied in with a single slice assignment.
+        
+        Args:
+            address: I2C device address (7-bit).
+            buffer: Writable bytes-like object to fill.
+            start (int, optional): Start byte offset. Defaults to 0.
+            end (int or None, optional): One-past-end byte offset. If None,
+                runs to the end of ``buffer``. Defaults to None.
+        
+        Raises:
+            OSError: If the device returns a different number of bytes
+                than were requested.
+        """
+        view = memoryview(buffer)
+        if view.itemsize != 1:
+            view = view.cast("B")
+        view = view[start:end]
+        length = len(view)
+        if not length:
+            return
+        data = self._dev_read(address, length)
+        if type(data) is memoryview:
+            if data.itemsize != 1:
+                data = data.cast("B")
+        elif not isinstance(data, (bytes, bytearray)):
+            # e.g. a list of ints: convert once so the copy is one memcpy
+            data = bytes(data)
+        if len(data) != length:
+            raise OSError(
+                f"CP2112 read from 0x{address:02x} returned {len(data)} "
+                f"bytes, expected {length}"
+            )
+        view[:] = data
     
-    def writeto(self, address, buffer, *, start=0, end=None, stop=True):
+    def writeto(self, address, buffer, *, start=0, end=None, stop=True, **kwargs):
         """Write data to I2C device.
         
         This method is intended to be compatible with the CircuitPython
@@ -29,24 +132,28 @@ class CP2112I2CBus:
         starts, so the ``stop`` argument is accepted for compatibility but
         is otherwise ignored.
         
+        Any buffer-protocol object is accepted (``bytes``, ``bytearray``,
+        ``memoryview``, ``array.array``). Drivers can keep a persistent
+        ``bytearray`` framebuffer and send parts of it with ``start`` and
+        ``end``: the selected bytes are copied exactly once, into the
+        ``bytes`` object the CP2112 device API requires. Whole ``bytes``
+        objects are passed through without any copy.
+        
         Args:
             address: I2C device address (7-bit)
             buffer: Bytes-like object containing data to write.
-            start (int, optional): Start index within ``buffer`` to write
-                from. Defaults to 0.
-            end (int or None, optional): One-past-end index within
+            start (int, optional): Start byte offset within ``buffer`` to
+                write from. Defaults to 0.
+            end (int or None, optional): One-past-end byte offset within
                 ``buffer`` to stop writing at. If None, writes through the
                 end of ``buffer``. Defaults to None.
             stop (bool, optional): Whether to generate a stop bit at the
                 end of the transfer. Accepted for API compatibility but
                 ignored because CP2112 always sends a stop. Defaults to True.
+            **kwargs: Other keyword arguments passed by callers written
+                against different ``busio`` versions; ignored.
         """
-        if end is None:
-            end = len(buffer)
-        # Use a memoryview to avoid copying when slicing, then convert to
-        # bytes for the underlying CP2112 device API.
-        view = memoryview(buffer)[start:end]
-        self.device.write(address, bytes(view))
+        self._dev_write(address, _out_bytes(buffer, start, end))
     
     def readfrom_into(self, address, buffer, *, start=0, end=None):
         """Read data from I2C device into buffer.
@@ -57,20 +164,17 @@ class CP2112I2CBus:
         Args:
             address: I2C device address (7-bit)
             buffer: Writable buffer to read data into.
-            start (int, optional): Start index within ``buffer`` where
-                received data should be stored. Defaults to 0.
-            end (int or None, optional): One-past-end index within
+            start (int, optional): Start byte offset within ``buffer``
+                where received data should be stored. Defaults to 0.
+            end (int or None, optional): One-past-end byte offset within
                 ``buffer`` where data storage should stop. If None, reads
                 through the end of ``buffer``. Defaults to None.
+        
+        Raises:
+            OSError: If the device returns fewer or more bytes than
+                requested.
         """
-        if end is None:
-            end = len(buffer)
-        length = end - start
-        if length <= 0:
-            return
-        data = self.device.read(address, length)
-        for i, byte in enumerate(data):
-            buffer[start + i] = byte
+        self._read_into(address, buffer, start, end)
     
     def writeto_then_readfrom(
         self,
@@ -97,35 +201,84 @@ class CP2112I2CBus:
             address: I2C device address (7-bit).
             buffer_out: Bytes-like object containing data to write.
             buffer_in: Writable buffer to receive the data read back.
-            out_start (int, optional): Start index within ``buffer_out`` to
-                write from. Defaults to 0.
-            out_end (int or None, optional): One-past-end index within
-                ``buffer_out`` to stop writing at. If None, writes through
+            out_start (int, optional): Start byte offset within
+                ``buffer_out`` to write from. Defaults to 0.
+            out_end (int or None, optional): One-past-end byte offset
+                within ``buffer_out`` to stop writing at. If None, writes through
                 the end of ``buffer_out``. Defaults to None.
-            in_start (int, optional): Start index within ``buffer_in`` where
-                received data should be stored. Defaults to 0.
-            in_end (int or None, optional): One-past-end index within
+            in_start (int, optional): Start byte offset within
+                ``buffer_in`` where received data should be stored.
+                Defaults to 0.
+            in_end (int or None, optional): One-past-end byte offset within
                 ``buffer_in`` where data storage should stop. If None, reads
                 through the end of ``buffer_in``. Defaults to None.
             stop (bool, optional): Accepted for API compatibility but
                 ignored; CP2112 always sends a stop between write and read.
+        
+        Raises:
+            OSError: If the device returns fewer or more bytes than
+                requested.
         """
-        # Handle output slice
-        if out_end is None:
-            out_end = len(buffer_out)
-        out_view = memoryview(buffer_out)[out_start:out_end]
-        if len(out_view):
-            self.device.write(address, bytes(out_view))
+        # Handle output slice, with the same byte offsets as writeto()
+        data = _out_bytes(buffer_out, out_start, out_end)
+        if data:
+            self._dev_write(address, data)
 
-        # Handle input slice
-        if in_end is None:
-            in_end = len(buffer_in)
-        in_length = in_end - in_start
-        if in_length <= 0:
-            return
-        data = self.device.read(address, in_length)
-        for i, byte in enumerate(data):
-            buffer_in[in_start + i] = byte
+        # Handle input slice, with the same byte offsets
+        self._read_into(address, buffer_in, in_start, in_end)
+    
+    def writeto_batch(self, address, chunks):
+        """Write several buffers to an I2C device as a single transfer.
+        
+        Each CP2112 transfer costs a full USB round-trip, so concatenating
+        chunks that would otherwise be sent back-to-back saves one
+        round-trip per extra chunk.
+        
+        Args:
+            address: I2C device address (7-bit).
+            chunks: Iterable of bytes-like objects, sent in order.
+        """
+        data = b"".join(chunks)
+        if data:
+            self._dev_write(address, data)
+    
+    def writeto_cmd_then_data(self, address, commands, data=b""):
+        """Send OLED controller commands and display data in one transfer.
+        
+        The transfer is framed by :func:`command_data_frame`.
+        
+        Args:
+            address: I2C device address (7-bit).
+            commands: Iterable of command byte values (0-255).
+            data (bytes-like, optional): Display data to write after the
+                commands. Defaults to empty.
+        """
+        self._dev_write(address, command_data_frame(commands, data))
+    
+    def writeto_fast(self, address, data, *, control=0x40):
+        """Stream OLED display data as transfers of one HID report each.
+        
+        A CP2112 write carries at most 61 data bytes per HID report, so
+        a long buffer costs several reports whatever its framing. This
+        sends ``data`` as a series of I2C transfers that each fill exactly
+        one report: the ``control`` byte followed by up to 60 data bytes.
+        The controller's address pointer keeps advancing across transfers,
+        so the result on the display is the same as one long write.
+        
+        Args:
+            address: I2C device address (7-bit).
+            data: Bytes-like display data, without a control byte.
+            control (int, optional): Control byte sent at the start of
+                every transfer. Defaults to 0x40 (Co=0, D/C=1: data).
+        """
+        view = data if type(data) is memoryview else memoryview(data)
+        if view.itemsize != 1:
+            view = view.cast("B")
+        write = self._dev_write
+        prefix = bytes((control,))
+        step = _HID_WRITE_MAX - 1
+        for i in range(0, len(view), step):
+            write(address, prefix + view[i:i + step])
     
     def try_lock(self):
         """Try to lock the bus.
@@ -144,22 +297,47 @@ class CP2112I2CBus:
         """
         pass
     
-    def scan(self):
+    def iter_scan(self, addresses=None):
+        """Scan I2C bus for devices, yielding each address as it is found.
+        
+        Each probe is a full CP2112 USB round-trip, so a caller looking for
+        a specific device can stop iterating at the first match instead of
+        waiting for the whole bus to be probed, e.g.
+        ``any(addr == 0x3C for addr in bus.iter_scan())``.
+        
+        Args:
+            addresses (iterable or None, optional): Addresses to probe.
+                If None, probes the full valid 7-bit range (0x08-0x77).
+                Defaults to None.
+        
+        Yields:
+            int: I2C address where a device responded
+        """
+        if addresses is None:
+            addresses = _SCAN_ADDRESSES
+        read = self._dev_read
+        for addr in addresses:
+            try:
+                # Try to read 1 byte to detect device presence
+                read(addr, 1)
+            except OSError:
+                # NACK: device not present at this address
+                continue
+            yield addr
+    
+    def scan(self, addresses=None):
         """Scan I2C bus for devices.
         
         Attempts to read from all valid I2C addresses to detect devices.
+        Callers that only care about a few addresses should pass them in
+        ``addresses``, or use :meth:`iter_scan` to stop early.
+        
+        Args:
+            addresses (iterable or None, optional): Addresses to probe.
+                If None, probes the full valid 7-bit range (0x08-0x77).
+                Defaults to None.
         
         Returns:
             list: List of I2C addresses where devices were found
         """
-        found = []
-        # Scan valid I2C 7-bit address range (0x08-0x77)
-        for addr in range(0x08, 0x78):
-            try:
-                # Try to read 1 byte to detect device presence
-                self.device.read(addr, 1)
-                found.append(addr)
-            except (OSError, IOError):
-                # Device not present at this address
-                pass
-        return found
+        return list(self.iter_scan(addresses))
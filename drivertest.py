@@ -11,14 +11,39 @@ Configuration (edit the variables below):
     - DRIVER_NAME: sh1106, ssd1306, ssd1305, or ssd1309
     - DISPLAY_TEXT: Any text to display on the OLED
     - I2C_ADDRESS: I2C address of the OLED display (usually 0x3C or 0x3D)
+    - I2C_CLOCK_HZ: I2C clock speed (400000 fast mode, 100000 standard mode)
     - USE_MULTIPLEXER: Set to True to use TCA9548A multiplexer
     - MULTIPLEXER_ADDRESS: I2C address of TCA9548A (usually 0x70)
     - MULTIPLEXER_CHANNEL: Channel on TCA9548A where OLED is connected (0-7)
 """
 
+import importlib
 import sys
 import time
 
+# Import CP2112 library for USB-to-I2C communication
+try:
+    import cp2112
+except ImportError as e:
+    print(f"Error: CP2112 library not available: {e}", file=sys.stderr)
+    print("Please install: pip3 install cp2112", file=sys.stderr)
+    sys.exit(1)
+
+# Import CP2112 I2C bus wrapper
+try:
+    from cp2112_i2c_bus import CP2112I2CBus
+except ImportError as e:
+    print(f"Error: CP2112 I2C bus wrapper not available: {e}", file=sys.stderr)
+    print("Please ensure cp2112_i2c_bus.py is in the same directory or on the Python path", file=sys.stderr)
+    sys.exit(1)
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError as e:
+    print(f"Error: Pillow not available: {e}", file=sys.stderr)
+    print("Please install: pip3 install Pillow", file=sys.stderr)
+    sys.exit(1)
+
 # ============================================================================
 # CONFIGURATION - Edit these values to customize your test
 # ============================================================================
@@ -33,6 +58,11 @@ DISPLAY_TEXT = "Hello World!"
 # I2C address (most OLED displays use 0x3C or 0x3D)
 I2C_ADDRESS = 0x3C
 
+# I2C clock speed in Hz. 400 kHz (fast mode) moves a full 1 KiB frame in
+# roughly a quarter of the time of 100 kHz; drop to 100000 if the display
+# misbehaves on long wires.
+I2C_CLOCK_HZ = 400000
+
 # TCA9548A Multiplexer Configuration
 USE_MULTIPLEXER = False          # Set to True to use TCA9548A multiplexer
 MULTIPLEXER_ADDRESS = 0x70       # I2C address of TCA9548A
@@ -46,6 +76,19 @@ HEIGHT = 64
 # END CONFIGURATION
 # ============================================================================
 
+# Supported drivers: name -> (module name, I2C driver class name)
+_DRIVERS = {
+    "sh1106": ("adafruit_sh1106", "SH1106_I2C"),
+    "ssd1306": ("adafruit_ssd1306", "SSD1306_I2C"),
+    "ssd1305": ("adafruit_ssd1305", "SSD1305_I2C"),
+    "ssd1309": ("adafruit_ssd1309", "SSD1309_I2C"),
+}
+
+# Drawing surface and font reused by every display_text() call
+_IMAGE = Image.new("1", (WIDTH, HEIGHT))
+_DRAW = ImageDraw.Draw(_IMAGE)
+_FONT = ImageFont.load_default()
+
 def init_display():
     """Initialize the OLED display with CP2112 USB-to-I2C bridge."""
     print(f"OLED Driver Test")
@@ -59,22 +102,6 @@ def init_display():
         print(f"Multiplexer: Not used")
     print()
     
-    # Import required libraries
-    try:
-        import cp2112
-    except ImportError as e:
-        print(f"Error: CP2112 library not available: {e}", file=sys.stderr)
-        print("Please install: pip3 install cp2112", file=sys.stderr)
-        sys.exit(1)
-    
-    # Import CP2112 I2C bus wrapper
-    try:
-        from cp2112_i2c_bus import CP2112I2CBus
-    except ImportError as e:
-        print(f"Error: CP2112 I2C bus wrapper not available: {e}", file=sys.stderr)
-        print("Please ensure cp2112_i2c_bus.py is in the same directory or on the Python path", file=sys.stderr)
-        sys.exit(1)
-    
     # Find and open CP2112 device
     print(f"Searching for CP2112 USB-to-I2C bridge...")
     devices = cp2112.find_devices()
@@ -91,7 +118,7 @@ def init_display():
     # Create CP2112 device instance
     try:
         i2c_device = cp2112.CP2112Device(device_path)
-        i2c_device.set_smbus_config(clock_speed=100000)  # 100kHz
+        i2c_device.set_smbus_config(clock_speed=I2C_CLOCK_HZ)
         print(f"✓ CP2112 device initialized")
     except Exception as e:
         print(f"Error initializing CP2112 device: {e}", file=sys.stderr)
@@ -121,24 +148,14 @@ def init_display():
     if i2c is None:
         i2c = CP2112I2CBus(i2c_device)
     
-    # Import the driver module
+    # Import only the selected driver module
+    if DRIVER_NAME not in _DRIVERS:
+        print(f"Error: Unsupported driver '{DRIVER_NAME}'", file=sys.stderr)
+        print(f"Supported drivers: {', '.join(_DRIVERS)}", file=sys.stderr)
+        sys.exit(1)
+    module_name, class_name = _DRIVERS[DRIVER_NAME]
     try:
-        if DRIVER_NAME == "sh1106":
-            import adafruit_sh1106
-            driver_module = adafruit_sh1106
-        elif DRIVER_NAME == "ssd1306":
-            import adafruit_ssd1306
-            driver_module = adafruit_ssd1306
-        elif DRIVER_NAME == "ssd1305":
-            import adafruit_ssd1305
-            driver_module = adafruit_ssd1305
-        elif DRIVER_NAME == "ssd1309":
-            import adafruit_ssd1309
-            driver_module = adafruit_ssd1309
-        else:
-            print(f"Error: Unsupported driver '{DRIVER_NAME}'", file=sys.stderr)
-            print("Supported drivers: sh1106, ssd1306, ssd1305, ssd1309", file=sys.stderr)
-            sys.exit(1)
+        driver_module = importlib.import_module(module_name)
     except ImportError as e:
         print(f"Error: Driver module not available: {e}", file=sys.stderr)
         print(f"Please install: pip3 install adafruit-circuitpython-{DRIVER_NAME}", file=sys.stderr)
@@ -147,13 +164,7 @@ def init_display():
     # Initialize the display
     print(f"Initializing {DRIVER_NAME.upper()} display...")
     try:
-        driver_class_name = f"{DRIVER_NAME.upper()}_I2C"
-        if not hasattr(driver_module, driver_class_name):
-            print(f"Error: Driver class '{driver_class_name}' not found in module", file=sys.stderr)
-            print(f"Available classes in module: {[attr for attr in dir(driver_module) if not attr.startswith('_')]}", file=sys.stderr)
-            sys.exit(1)
-        
-        driver_class = getattr(driver_module, driver_class_name)
+        driver_class = getattr(driver_module, class_name)
         oled = driver_class(WIDTH, HEIGHT, i2c, addr=I2C_ADDRESS)
     except Exception as e:
         print(f"Error initializing display: {e}", file=sys.stderr)
@@ -170,14 +181,8 @@ def init_display():
 
 def display_text(oled, text):
     """Display text on the OLED screen."""
-    from PIL import Image, ImageDraw, ImageFont
-    
-    # Create blank image for drawing
-    image = Image.new("1", (WIDTH, HEIGHT))
-    draw = ImageDraw.Draw(image)
-    
-    # Use default font
-    font = ImageFont.load_default()
+    # Clear the shared drawing surface
+    _DRAW.rectangle((0, 0, WIDTH, HEIGHT), fill=0)
     
     # Calculate text position to center it
     # For multi-line text, split by newlines
@@ -188,11 +193,11 @@ def display_text(oled, text):
     
     for line in lines:
         # Draw each line
-        draw.text((5, y_position), line, font=font, fill=255)
+        _DRAW.text((5, y_position), line, font=_FONT, fill=255)
         y_position += 12  # Move down for next line
     
     # Display the image on OLED
-    oled.image(image)
+    oled.image(_IMAGE)
     oled.show()
     
     print(f"✓ Text displayed: '{text}'")
@@ -3,73 +3,121 @@
 OLED Display Management
 Displays local IP address and streaming status on OLED display
 Supports multiple drivers: SSD1306, SH1106, SSD1305, SSD1309
-Connected via CP2112 USB-to-I2C bridge with optional TCA9548A multiplexer
+Connected via CP2112 USB-to-I2C bridge with optional TCA9548A multiplexer,
+or directly to the board's I2C pins (OLED_BUS=board)
 
 Works on any system with USB support (Linux, Orange Pi, Raspberry Pi, etc.)
+
+The I2C clock defaults to 400 kHz (fast mode), which all supported
+controllers and the CP2112 handle. At ~9 clock cycles per byte a full
+1 KiB frame takes ~92 ms on the wire at 100 kHz versus ~23 ms at 400 kHz.
+Set I2C_CLOCK_HZ=100000 for long wires or marginal pull-ups.
+
+On the board's native bus the Linux kernel owns the clock: I2C_CLOCK_HZ
+is passed to busio.I2C, but the rate actually used comes from the device
+tree (e.g. dtparam=i2c_arm_baudrate=400000 on a Raspberry Pi). See the
+README for details.
 """
 
 import time
 import sys
 import subprocess
 import os
+import errno
+import fcntl
+import functools
+import glob
+import importlib
+import queue
+import select
+import shlex
+import socket
+import struct
+import threading
 
-# Import CP2112 library for USB-to-I2C communication
-try:
-    import cp2112
-except ImportError as e:
-    print(f"Error: CP2112 library not available: {e}", file=sys.stderr)
-    print("Please install: pip3 install cp2112", file=sys.stderr)
+# I2C bus backend
+# Set OLED_BUS environment variable to choose how the display is reached:
+#   cp2112 - CP2112 USB-to-I2C bridge (default)
+#   board  - the board's native I2C pins via Adafruit Blinka (board/busio)
+# Only the selected backend's libraries are imported.
+OLED_BUS = os.environ.get('OLED_BUS', 'cp2112').lower()
+
+if OLED_BUS == 'cp2112':
+    # Import CP2112 library for USB-to-I2C communication
+    try:
+        import cp2112
+    except ImportError as e:
+        print(f"Error: CP2112 library not available: {e}", file=sys.stderr)
+        print("Please install: pip3 install cp2112", file=sys.stderr)
+        sys.exit(1)
+elif OLED_BUS == 'board':
+    # Import Blinka for the board's native I2C bus
+    try:
+        import board
+        import busio
+    except ImportError as e:
+        print(f"Error: Blinka (board/busio) not available: {e}", file=sys.stderr)
+        print("Please install: pip3 install adafruit-blinka", file=sys.stderr)
+        sys.exit(1)
+    except NotImplementedError as e:
+        # Blinka raises this from `import board` when platform detection
+        # does not recognise the board
+        print(f"Error: Blinka (board/busio) not available: {e}", file=sys.stderr)
+        print("This board is not supported by Adafruit Blinka; use OLED_BUS=cp2112 "
+              "or check https://circuitpython.org/blinka for supported boards", file=sys.stderr)
+        sys.exit(1)
+else:
+    print(f"Error: Unsupported OLED_BUS '{OLED_BUS}'", file=sys.stderr)
+    print("Supported buses: cp2112, board", file=sys.stderr)
     sys.exit(1)
 
-# Import CP2112 I2C bus wrapper
+# Import CP2112 I2C bus wrapper, which also frames OLED command/data
+# transfers for show_region() on either bus
 try:
-    from cp2112_i2c_bus import CP2112I2CBus
+    from cp2112_i2c_bus import CP2112I2CBus, command_data_frame
 except ImportError as e:
     print(f"Error: CP2112 I2C bus wrapper not available: {e}", file=sys.stderr)
     print("Please ensure cp2112_i2c_bus.py is installed in the same directory or on the Python path", file=sys.stderr)
     sys.exit(1)
 
-from PIL import Image, ImageDraw, ImageFont
-
-# Import Adafruit OLED libraries
-DRIVER_MODULES = {}
-try:
-    import adafruit_ssd1306
-    DRIVER_MODULES['ssd1306'] = adafruit_ssd1306
-except ImportError:
-    pass
-
+# Optional: query systemd over D-Bus instead of spawning systemctl
 try:
-    import adafruit_sh1106
-    DRIVER_MODULES['sh1106'] = adafruit_sh1106
+    from jeepney import DBusAddress, DBusErrorResponse, Properties, new_method_call
+    from jeepney.bus_messages import MatchRule, message_bus
+    from jeepney.io.blocking import open_dbus_connection
+    from jeepney.wrappers import unwrap_msg
 except ImportError:
-    pass
+    open_dbus_connection = None
 
+# Optional: list interface addresses portably when /proc/net/route is missing
 try:
-    import adafruit_ssd1305
-    DRIVER_MODULES['ssd1305'] = adafruit_ssd1305
+    import psutil
 except ImportError:
-    pass
+    psutil = None
 
-try:
-    import adafruit_ssd1309
-    DRIVER_MODULES['ssd1309'] = adafruit_ssd1309
-except ImportError:
-    pass
-
-if not DRIVER_MODULES:
-    print("Error: No OLED driver libraries available", file=sys.stderr)
-    print("Please install at least one of:", file=sys.stderr)
-    print("  sudo pip3 install adafruit-circuitpython-ssd1306", file=sys.stderr)
-    print("  sudo pip3 install adafruit-circuitpython-sh1106", file=sys.stderr)
-    print("  sudo pip3 install adafruit-circuitpython-ssd1305", file=sys.stderr)
-    print("  sudo pip3 install adafruit-circuitpython-ssd1309", file=sys.stderr)
-    sys.exit(1)
+# Supported OLED drivers: name -> (module name, I2C driver class name).
+# Only the driver selected by OLED_DRIVER is imported, in init_display().
+_DRIVERS = {
+    'ssd1306': ('adafruit_ssd1306', 'SSD1306_I2C'),
+    'sh1106': ('adafruit_sh1106', 'SH1106_I2C'),
+    'ssd1305': ('adafruit_ssd1305', 'SSD1305_I2C'),
+    'ssd1309': ('adafruit_ssd1309', 'SSD1309_I2C'),
+}
 
 # Display dimensions
 WIDTH = 128
 HEIGHT = 64
 
+# Size of the driver framebuffer: one byte per 8-pixel column of each page
+PAGES = HEIGHT // 8
+FRAME_SIZE = WIDTH * PAGES
+
+# Drivers whose controller only has page addressing (no 0x21/0x22 window),
+# and the SH1106 column start commands: its 132-column RAM is centred, so
+# column 2 is the first visible one
+_PAGE_ADDRESSING_DRIVERS = ('sh1106',)
+_SH1106_COLUMN_START = (0x02, 0x10)
+
 # OLED Driver Selection
 # Set OLED_DRIVER environment variable to choose driver
 # Supported: ssd1306, sh1106, ssd1305, ssd1309
@@ -88,103 +136,597 @@ USE_MULTIPLEXER = os.environ.get('USE_MULTIPLEXER', 'false').lower() in ('true',
 MULTIPLEXER_ADDRESS = int(os.environ.get('MULTIPLEXER_ADDRESS', '0x70'), 16)
 MULTIPLEXER_CHANNEL = int(os.environ.get('MULTIPLEXER_CHANNEL', '0'))
 
+# I2C clock speed in Hz (400kHz fast mode by default, see module docstring)
+I2C_CLOCK_HZ = int(os.environ.get('I2C_CLOCK_HZ', '400000'))
+
+# ioctl that reads an interface's IPv4 address (from <linux/sockios.h>)
+SIOCGIFADDR = 0x8915
+
+# How long (seconds) a looked-up IP address / stream status stays valid.
+# Both rarely change, so most polls are served from these caches.
+IP_CACHE_TTL = 60
+STATUS_CACHE_TTL = 15
+
+_IP_CACHE = {"value": None, "ts": 0.0}
+_STATUS_CACHE = {"value": None, "ts": 0.0}
+
+# systemd unit whose state is shown as the stream status
+STREAM_SERVICE = 'x11stream.service'
+
+# Seconds between display refreshes when polling, and the (much longer)
+# fallback poll used once systemd pushes unit state changes over D-Bus.
+# Set OLED_POLL_INTERVAL to change the polling rate; the IP address and
+# stream state rarely change, so polling more often mostly wastes work.
+try:
+    POLL_INTERVAL = float(os.environ.get('OLED_POLL_INTERVAL', '30'))
+except ValueError:
+    POLL_INTERVAL = None
+# Also rejects 0, negative, nan and inf, which would spin or never poll
+if POLL_INTERVAL is None or not 0 < POLL_INTERVAL < float('inf'):
+    print(f"Error: Invalid OLED_POLL_INTERVAL '{os.environ.get('OLED_POLL_INTERVAL')}'", file=sys.stderr)
+    print("OLED_POLL_INTERVAL must be a positive number of seconds", file=sys.stderr)
+    sys.exit(1)
+EVENT_POLL_INTERVAL = max(60, POLL_INTERVAL)
+
+# Open system bus connection and unit object used for status queries,
+# and whether a watcher thread is receiving the unit's state changes;
+# set by connect_systemd()
+_SYSTEMD = {"conn": None, "unit": None, "watching": False}
+
+# rtnetlink multicast groups for link and IPv4 address changes
+# (from <linux/rtnetlink.h>)
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_IFADDR = 0x10
+
+# Set by the watcher threads when the x11stream unit changes state or a
+# network address changes
+_STATE_CHANGED = threading.Event()
+
+# Environment for systemctl fallback calls
+_C_LOCALE_ENV = {**os.environ, "LC_ALL": "C", "LANG": "C"}
+
+# Long-lived shell that runs the systemctl fallback, set by _shell_status()
+_SHELL = {"proc": None}
+
+# Marker echoed after each shell command, followed by its exit status
+_SHELL_END = "__END__"
+
+# pidfd of the ffmpeg x11grab process, set by _ffmpeg_running()
+_FFMPEG = {"pidfd": None}
+
+# Last message printed by _warn() for each source of repeated failures
+_WARNINGS = {}
+
+# Set OLED_DEBUG=1 to print tracebacks for initialization errors
+OLED_DEBUG = os.environ.get('OLED_DEBUG', '').lower() in ('true', '1', 'yes')
+
+def _warn(source, message):
+    """Print a warning to stderr, unless it repeats the last one from source.
+    
+    Checks that run on every poll would otherwise print the same failure
+    every few seconds, and a backed-up journal can then stall the loop.
+    
+    Args:
+        source: Short name of the failing check.
+        message: Text to print.
+    """
+    if _WARNINGS.get(source) != message:
+        print(message, file=sys.stderr)
+        _WARNINGS[source] = message
+
+def _clear_warning(source):
+    """Forget source's last warning once it succeeds, so a new failure prints."""
+    _WARNINGS.pop(source, None)
+
 def get_local_ip():
+    """Get the local IP address of the machine, cached for IP_CACHE_TTL.
+    
+    Returns:
+        str: The local IP address, or "No IP" if not found.
+    """
+    now = time.monotonic()
+    if _IP_CACHE["value"] and now - _IP_CACHE["ts"] < IP_CACHE_TTL:
+        return _IP_CACHE["value"]
+    ip = _query_local_ip()
+    if ip != "No IP":
+        _clear_warning("ip")
+    # Failed lookups are not cached so the next poll retries
+    _IP_CACHE["value"] = ip if ip != "No IP" else None
+    _IP_CACHE["ts"] = now
+    return ip
+
+def _query_local_ip():
     """Get the local IP address of the machine.
     
-    Uses the same approach as x11stream.sh:
-    1. First tries 'ip route get 1' which queries the routing table for the
-       primary interface used to reach 1.0.0.0 (a public IP). This reliably
-       finds the IP address of the interface with the default route.
-    2. Falls back to 'hostname -I' if the first method fails.
+    Finds the same address as 'ip route get 1' in x11stream.sh without
+    spawning a process:
+    1. Connects a UDP socket towards 1.1.1.1. A UDP connect sends no
+       packets; the kernel only selects the route, so the socket's local
+       address is the IP of the interface with the default route.
+    2. Otherwise reads the address of the interface a route in
+       /proc/net/route points at (see _route_interface_ip()).
+    3. Otherwise takes the first interface address psutil reports, on
+       systems without /proc/net/route (see _interface_ip()).
+    4. Falls back to resolving the hostname.
     
     Returns:
         str: The local IP address, or "No IP" if not found.
     """
     try:
-        # Try using ip route first (same as in x11stream.sh)
-        # This queries which interface would be used to reach 1.0.0.0
-        result = subprocess.run(
-            ["ip", "route", "get", "1"],
-            capture_output=True,
-            text=True,
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.connect(("1.1.1.1", 80))
+            return sock.getsockname()[0]
+        finally:
+            sock.close()
+    except OSError:
+        pass
+    
+    ip = _route_interface_ip() or _interface_ip()
+    if ip:
+        return ip
+    
+    # Fallback to hostname resolution
+    try:
+        ip = socket.gethostbyname(socket.gethostname())
+        # Debian/Ubuntu map the hostname to 127.0.1.1, which is useless here
+        if socket.inet_aton(ip)[0] != 127:
+            return ip
+    except OSError as e:
+        _warn("ip", f"Error getting IP address: {e}")
+    
+    return "No IP"
+
+def _route_interface_ip():
+    """Get the IPv4 address of the primary network interface.
+    
+    Reads the routing table from /proc/net/route and asks the kernel for
+    the address of the interface with the default route, or, on a host
+    without one, the first interface that has any route. Nothing is
+    spawned and no network access is needed.
+    
+    Returns:
+        str: The interface's IP address, or None if not found.
+    """
+    try:
+        with open('/proc/net/route') as f:
+            # Skip the header; columns are Iface, Destination, Gateway, Flags, ...
+            routes = [line.split() for line in f.readlines()[1:]]
+    except OSError:
+        return None
+    
+    interfaces = []
+    for fields in routes:
+        # Only routes that are up (RTF_UP)
+        if len(fields) < 4 or fields[0] == 'lo' or not int(fields[3], 16) & 0x1:
+            continue
+        if fields[1] == '00000000':
+            interfaces.insert(0, fields[0])
+        else:
+            interfaces.append(fields[0])
+    
+    if not interfaces:
+        return None
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    except OSError:
+        return None
+    try:
+        for interface in interfaces:
+            try:
+                request = struct.pack('256s', interface[:15].encode())
+                reply = fcntl.ioctl(sock.fileno(), SIOCGIFADDR, request)
+            except OSError:
+                # Interface has no IPv4 address
+                continue
+            # struct ifreq: 16-byte name, then sockaddr_in with the address at offset 4
+            return socket.inet_ntoa(reply[20:24])
+    finally:
+        sock.close()
+    return None
+
+def _interface_ip():
+    """Get the first usable IPv4 address of any network interface.
+    
+    Uses psutil.net_if_addrs(), which works on Linux, the BSDs and macOS
+    without spawning a process. Loopback and link-local (169.254.x.x)
+    addresses are skipped.
+    
+    Returns:
+        str: The IP address, or None if psutil is not installed or no
+            address was found.
+    """
+    if psutil is None:
+        return None
+    try:
+        interfaces = psutil.net_if_addrs()
+    except OSError:
+        return None
+    for addresses in interfaces.values():
+        for address in addresses:
+            if address.family != socket.AF_INET:
+                continue
+            first, second = socket.inet_aton(address.address)[:2]
+            if first == 127 or (first, second) == (169, 254):
+                continue
+            return address.address
+    return None
+
+def watch_network():
+    """Watch for network address changes over rtnetlink.
+    
+    Subscribes to the kernel's link and IPv4 address notifications and
+    hands the socket to a watcher thread that drops the cached IP and
+    sets _STATE_CHANGED, so a new address is shown straight away instead
+    of after the cache expires.
+    
+    Returns:
+        bool: True if watching, False if netlink is unavailable (the IP
+            address is then only refreshed by polling).
+    """
+    if not hasattr(socket, 'AF_NETLINK'):
+        return False
+    try:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+    except OSError as e:
+        print(f"Warning: Unable to watch network changes: {e}", file=sys.stderr)
+        return False
+    try:
+        sock.bind((0, RTMGRP_LINK | RTMGRP_IPV4_IFADDR))
+    except OSError as e:
+        print(f"Warning: Unable to watch network changes: {e}", file=sys.stderr)
+        sock.close()
+        return False
+    
+    threading.Thread(
+        target=_watch_netlink,
+        args=(sock,),
+        name="netlink-watcher",
+        daemon=True
+    ).start()
+    return True
+
+def _watch_netlink(sock):
+    """Set _STATE_CHANGED for every link or address notification.
+    
+    Runs in the watcher thread started by watch_network(). The messages
+    themselves are not parsed: any of them may change the address that
+    get_local_ip() picks, so it simply looks again.
+    
+    Args:
+        sock: Netlink socket bound to the link and IPv4 address groups.
+    """
+    while True:
+        try:
+            sock.recv(65536)
+        except OSError as e:
+            # ENOBUFS: the socket overflowed and notifications were dropped,
+            # which still means something changed; keep watching
+            if e.errno != errno.ENOBUFS:
+                print(f"Warning: Stopped watching network changes: {e}", file=sys.stderr)
+                _STATE_CHANGED.set()
+                sock.close()
+                return
+        _IP_CACHE["value"] = None
+        _STATE_CHANGED.set()
+
+def get_stream_status():
+    """Check if the x11stream service is running, cached for STATUS_CACHE_TTL.
+    
+    Returns:
+        str: "Streaming" if active, "Stopped" if inactive, "Unknown" if can't determine.
+    """
+    now = time.monotonic()
+    if _STATUS_CACHE["value"] and now - _STATUS_CACHE["ts"] < STATUS_CACHE_TTL:
+        return _STATUS_CACHE["value"]
+    status = _query_stream_status()
+    # "Unknown" means the check failed, so don't cache it
+    _STATUS_CACHE["value"] = status if status != "Unknown" else None
+    _STATUS_CACHE["ts"] = now
+    return status
+
+def connect_systemd():
+    """Connect to systemd over the D-Bus system bus.
+    
+    Resolves the x11stream unit object once, so each status check is a
+    single property read on an open connection instead of a systemctl
+    process. A second connection subscribes to the unit's
+    PropertiesChanged signal and is handed to a watcher thread that sets
+    _STATE_CHANGED, so wait_for_change() returns as soon as the
+    unit changes state.
+    
+    Returns:
+        bool: True if connected, False if D-Bus is unavailable (status
+            checks then fall back to systemctl).
+    """
+    if open_dbus_connection is None:
+        return False
+    conn = None
+    signal_conn = None
+    try:
+        conn = open_dbus_connection(bus='SYSTEM')
+        manager = DBusAddress(
+            '/org/freedesktop/systemd1',
+            bus_name='org.freedesktop.systemd1',
+            interface='org.freedesktop.systemd1.Manager'
+        )
+        # LoadUnit (unlike GetUnit) also works while the unit is inactive
+        reply = conn.send_and_get_reply(
+            new_method_call(manager, 'LoadUnit', 's', (STREAM_SERVICE,)),
             timeout=2
         )
-        if result.returncode == 0:
-            # Match the shell script logic: awk '{print $7; exit}'
-            # The 7th field contains the source IP address
-            parts = result.stdout.split()
-            if len(parts) >= 7:
-                ip = parts[6]  # 0-indexed, so field 7 is index 6
-                # Validate it's a valid IPv4 address
-                try:
-                    octets = ip.split('.')
-                    if len(octets) == 4 and all(0 <= int(o) <= 255 for o in octets):
-                        return ip
-                except (ValueError, IndexError):
-                    pass
+        unit_path = unwrap_msg(reply)[0]
         
-        # Fallback to hostname -I
-        result = subprocess.run(
-            ["hostname", "-I"],
-            capture_output=True,
-            text=True,
+        # Signals get their own connection: jeepney's blocking connections
+        # must not be shared between the main loop and the watcher thread
+        signal_conn = open_dbus_connection(bus='SYSTEM')
+        # systemd only emits unit signals while someone is subscribed
+        reply = signal_conn.send_and_get_reply(
+            new_method_call(manager, 'Subscribe'),
             timeout=2
         )
-        if result.returncode == 0:
-            ips = result.stdout.strip().split()
-            if ips:
-                return ips[0]
-    except (subprocess.SubprocessError, FileNotFoundError, OSError) as e:
-        print(f"Error getting IP address: {e}", file=sys.stderr)
+        unwrap_msg(reply)
+        rule = MatchRule(
+            type='signal',
+            interface='org.freedesktop.DBus.Properties',
+            member='PropertiesChanged',
+            path=unit_path
+        )
+        rule.add_arg_condition(0, 'org.freedesktop.systemd1.Unit')
+        reply = signal_conn.send_and_get_reply(message_bus.AddMatch(rule), timeout=2)
+        unwrap_msg(reply)
+    except (OSError, DBusErrorResponse, RuntimeError, ValueError) as e:
+        # jeepney raises RuntimeError for unsupported bus transports and
+        # AuthenticationError (a ValueError) when the bus rejects us
+        print(f"Warning: Unable to connect to systemd over D-Bus: {e}", file=sys.stderr)
+        for c in (conn, signal_conn):
+            if c is not None:
+                c.close()
+        return False
     
-    return "No IP"
+    _SYSTEMD["conn"] = conn
+    _SYSTEMD["unit"] = DBusAddress(
+        unit_path,
+        bus_name='org.freedesktop.systemd1',
+        interface='org.freedesktop.systemd1.Unit'
+    )
+    _SYSTEMD["watching"] = True
+    threading.Thread(
+        target=_watch_unit_signals,
+        args=(signal_conn, signal_conn.filter(rule).queue),
+        name="systemd-watcher",
+        daemon=True
+    ).start()
+    return True
 
-def get_stream_status():
-    """Check if the x11stream service is running.
+def _watch_unit_signals(conn, signals):
+    """Set _STATE_CHANGED for every x11stream unit PropertiesChanged signal.
+    
+    Runs in the watcher thread started by connect_systemd().
+    
+    Args:
+        conn: D-Bus connection subscribed to the unit's signals.
+        signals: Queue the connection filters those signals into.
+    """
+    try:
+        while True:
+            conn.recv_until_filtered(signals)
+            # Make the next get_stream_status() read the new state
+            _STATUS_CACHE["value"] = None
+            _STATE_CHANGED.set()
+    except OSError as e:
+        # Lost the bus: the main loop goes back to polling
+        print(f"Warning: Lost D-Bus connection to systemd: {e}", file=sys.stderr)
+        _SYSTEMD["watching"] = False
+        _STATE_CHANGED.set()
+        conn.close()
+
+def wait_for_change(deadline):
+    """Wait until the unit state or an address changes, or deadline passes.
+    
+    Without D-Bus or netlink watchers this just sleeps until the deadline.
+    
+    Args:
+        deadline: time.monotonic() value to wait until.
+    
+    Returns:
+        bool: True if woken by a change, False on timeout.
+    """
+    if _STATE_CHANGED.wait(max(0.0, deadline - time.monotonic())):
+        _STATE_CHANGED.clear()
+        return True
+    return False
+
+def _query_stream_status():
+    """Query whether the x11stream service is running.
+    
+    Reads the unit's ActiveState over D-Bus when connect_systemd() has
+    succeeded, otherwise asks systemctl (or looks for ffmpeg).
     
     Returns:
         str: "Streaming" if active, "Stopped" if inactive, "Unknown" if can't determine.
     """
+    if _SYSTEMD["conn"] is not None:
+        try:
+            reply = _SYSTEMD["conn"].send_and_get_reply(
+                Properties(_SYSTEMD["unit"]).get('ActiveState'),
+                timeout=2
+            )
+            # Property values arrive as (signature, value) variants
+            state = unwrap_msg(reply)[0][1]
+            _clear_warning("dbus")
+            return "Streaming" if state == "active" else "Stopped"
+        except (OSError, DBusErrorResponse) as e:
+            _warn("dbus", f"Warning: Unable to query systemd over D-Bus: {e}")
+    
     try:
-        result = subprocess.run(
-            ["systemctl", "is-active", "x11stream.service"],
-            capture_output=True,
-            text=True,
+        # --quiet reports through the exit code only (0 == active)
+        returncode = _shell_status(
+            f"systemctl --quiet is-active {shlex.quote(STREAM_SERVICE)}",
             timeout=2
         )
-        if result.returncode == 0 and result.stdout.strip() == "active":
-            return "Streaming"
-        else:
-            return "Stopped"
+        if returncode == 127:
+            # The shell could not find systemctl
+            raise FileNotFoundError("systemctl not found")
+        _clear_warning("systemctl")
+        return "Streaming" if returncode == 0 else "Stopped"
     except (subprocess.SubprocessError, FileNotFoundError, OSError) as e:
         # Log systemctl failure before attempting fallback
-        print(f"Warning: Unable to check systemctl status: {e}", file=sys.stderr)
+        _warn("systemctl", f"Warning: Unable to check systemctl status: {e}")
         # If systemctl is not available, check for ffmpeg process
         try:
-            result = subprocess.run(
-                ["pgrep", "-f", "ffmpeg.*x11grab"],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            if result.returncode == 0:
+            running = _ffmpeg_running()
+            _clear_warning("ffmpeg")
+            if running:
                 return "Streaming"
-        except (subprocess.SubprocessError, FileNotFoundError, OSError) as e:
+        except OSError as e:
             # Failed to check ffmpeg process; fall back to reporting unknown status
-            print(f"Warning: Unable to check ffmpeg streaming process: {e}", file=sys.stderr)
+            _warn("ffmpeg", f"Warning: Unable to check ffmpeg streaming process: {e}")
     
     return "Unknown"
 
+def _shell_status(command, timeout):
+    """Run a command in the long-lived shell and return its exit status.
+    
+    The shell is started on first use and kept open, so each check costs
+    a pipe write and read instead of a fork and exec of a new process.
+    It runs in the C locale, which saves systemctl from loading
+    translations. A shell that times out or dies is discarded and a new
+    one started on the next call.
+    
+    Args:
+        command: Shell command line; callers must quote any arguments.
+        timeout: Seconds to wait for the command to finish.
+    
+    Returns:
+        int: The command's exit status.
+    
+    Raises:
+        subprocess.TimeoutExpired: If the command did not finish in time.
+        OSError: If the shell could not be started or exited.
+    """
+    proc = _SHELL["proc"]
+    if proc is None or proc.poll() is not None:
+        proc = subprocess.Popen(
+            ["/bin/sh"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=_C_LOCALE_ENV,
+            bufsize=0
+        )
+        _SHELL["proc"] = proc
+    
+    try:
+        # Command output goes to /dev/null, so the only stdout line is the
+        # marker with the exit status
+        proc.stdin.write(
+            f'{command} >/dev/null 2>&1; echo "{_SHELL_END} $?"\n'.encode()
+        )
+        deadline = time.monotonic() + timeout
+        line = b""
+        while not line.endswith(b"\n"):
+            remaining = deadline - time.monotonic()
+            readable, _, _ = select.select([proc.stdout], [], [], max(0.0, remaining))
+            if not readable:
+                raise subprocess.TimeoutExpired(command, timeout)
+            chunk = proc.stdout.read(64)
+            if not chunk:
+                raise OSError("shell exited unexpectedly")
+            line += chunk
+        fields = line.split()
+        if len(fields) != 2 or fields[0] != _SHELL_END.encode() or not fields[1].isdigit():
+            raise OSError(f"unexpected shell output: {line!r}")
+        return int(fields[1])
+    except (OSError, subprocess.TimeoutExpired):
+        # Don't reuse a shell that may still be running the command
+        proc.kill()
+        proc.wait()
+        _SHELL["proc"] = None
+        raise
+
+def _find_ffmpeg_pid():
+    """Find the ffmpeg x11grab process by scanning /proc.
+    
+    Returns:
+        int: PID of the first matching process, or None if not running.
+    """
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                cmdline = f.read()
+        except OSError:
+            # Process exited while scanning
+            continue
+        # Same match as `pgrep -f 'ffmpeg.*x11grab'`
+        index = cmdline.find(b'ffmpeg')
+        if index != -1 and b'x11grab' in cmdline[index:]:
+            return int(entry)
+    return None
+
+def _ffmpeg_running():
+    """Check whether the ffmpeg x11grab process is running.
+    
+    Once found, the process is tracked through a pidfd, which becomes
+    readable when it exits, so later checks are a single non-blocking
+    poll instead of a /proc scan.
+    
+    Returns:
+        bool: True if ffmpeg is capturing the display.
+    """
+    pidfd = _FFMPEG["pidfd"]
+    if pidfd is not None:
+        readable, _, _ = select.select([pidfd], [], [], 0)
+        if not readable:
+            return True
+        # Process exited: forget it and look for a new one
+        os.close(pidfd)
+        _FFMPEG["pidfd"] = None
+    
+    pid = _find_ffmpeg_pid()
+    if pid is None:
+        return False
+    try:
+        _FFMPEG["pidfd"] = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return False
+    except (AttributeError, OSError):
+        # No pidfd support (Python < 3.9 or Linux < 5.3): rescan next time
+        pass
+    return True
+
 def check_i2c_available():
-    """Check if CP2112 USB-to-I2C bridge is available.
+    """Check if the configured I2C bus is available.
     
     Performs diagnostic checks:
-    1. Checks for CP2112 USB devices
-    2. Provides helpful error messages if CP2112 is not found
+    1. Checks for CP2112 USB devices, or for /dev/i2c-* nodes when using
+       the board's native I2C bus
+    2. Provides helpful error messages if the bus is not found
     
     Returns:
-        bool: True if CP2112 appears to be available, False otherwise
+        list or None: The CP2112 devices found, or the /dev/i2c-* nodes
+        when using the board's native I2C bus; None if none were found.
+        Pass it on to init_display() so USB HID devices are enumerated
+        only once per start.
     """
+    if OLED_BUS == 'board':
+        print("Performing native I2C auto-check...")
+        buses = sorted(glob.glob('/dev/i2c-*'))
+        if not buses:
+            print("Error: No I2C buses found (/dev/i2c-*)", file=sys.stderr)
+            print("Please check:", file=sys.stderr)
+            print("  - I2C is enabled in the board's device tree overlays", file=sys.stderr)
+            print("  - The i2c-dev kernel module is loaded", file=sys.stderr)
+            return None
+        
+        print(f"✓ Found {len(buses)} I2C bus(es)")
+        for bus in buses:
+            print(f"  {bus}")
+        
+        return buses
+    
     print("Performing CP2112 USB-to-I2C auto-check...")
     
     # Check for CP2112 devices
@@ -196,45 +738,93 @@ def check_i2c_available():
             print("  - CP2112 device is connected via USB", file=sys.stderr)
             print("  - USB device permissions are correct (may need udev rules)", file=sys.stderr)
             print("  - Device is not in use by another application", file=sys.stderr)
-            return False
+            return None
         
         print(f"✓ Found {len(devices)} CP2112 USB-to-I2C bridge device(s)")
         for i, device in enumerate(devices):
             print(f"  Device {i}: {device}")
         
-        return True
+        return devices
         
     except Exception as e:
         print(f"Error checking for CP2112 devices: {e}", file=sys.stderr)
-        return False
+        return None
 
-def init_display():
-    """Initialize the CP2112 USB-to-I2C connection and OLED display."""
+def open_i2c_bus(devices=None):
+    """Open the I2C bus selected by OLED_BUS.
+    
+    Args:
+        devices: CP2112 devices from check_i2c_available(). If None, they
+            are enumerated again. Ignored for the board's native bus.
+    
+    Returns:
+        The busio-compatible I2C bus, or None if it could not be opened.
+    """
+    if OLED_BUS == 'board':
+        print("Using native I2C bus (board.SCL/board.SDA)")
+        return busio.I2C(board.SCL, board.SDA, frequency=I2C_CLOCK_HZ)
+    
+    # Find and open CP2112 device, reusing the auto-check's result
+    if not devices:
+        devices = cp2112.find_devices()
+    if not devices:
+        print("Error: No CP2112 USB-to-I2C bridge devices found", file=sys.stderr)
+        return None
+    
+    # Use the first available CP2112 device
+    device_path = devices[0]
+    print(f"Using CP2112 device: {device_path}")
+    
+    # Create CP2112 device instance
+    i2c_device = cp2112.CP2112Device(device_path)
+    
+    # Configure I2C speed
+    i2c_device.set_smbus_config(clock_speed=I2C_CLOCK_HZ)
+    
+    return CP2112I2CBus(i2c_device)
+
+def _load_driver(name):
+    """Import the Adafruit library for an OLED driver.
+    
+    Args:
+        name: Driver name, one of the keys of _DRIVERS.
+    
+    Returns:
+        The driver's I2C display class.
+    
+    Raises:
+        ImportError: If the driver library is not installed.
+    """
+    module_name, class_name = _DRIVERS[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+def init_display(devices=None):
+    """Initialize the I2C connection and OLED display.
+    
+    Args:
+        devices: I2C devices from check_i2c_available(), passed on to
+            open_i2c_bus().
+    """
     try:
         # Validate driver selection
-        if OLED_DRIVER not in DRIVER_MODULES:
-            available = ', '.join(DRIVER_MODULES.keys())
+        if OLED_DRIVER not in _DRIVERS:
+            available = ', '.join(_DRIVERS.keys())
             print(f"Error: Unsupported driver '{OLED_DRIVER}'", file=sys.stderr)
             print(f"Available drivers: {available}", file=sys.stderr)
             return None
         
-        print(f"Initializing {OLED_DRIVER.upper()} display at I2C address 0x{I2C_ADDRESS:02X}...")
-        
-        # Find and open CP2112 device
-        devices = cp2112.find_devices()
-        if not devices:
-            print("Error: No CP2112 USB-to-I2C bridge devices found", file=sys.stderr)
+        try:
+            driver_class = _load_driver(OLED_DRIVER)
+        except ImportError as e:
+            print(f"Error: OLED driver library not available: {e}", file=sys.stderr)
+            print(f"Please install: pip3 install adafruit-circuitpython-{OLED_DRIVER}", file=sys.stderr)
             return None
         
-        # Use the first available CP2112 device
-        device_path = devices[0]
-        print(f"Using CP2112 device: {device_path}")
-        
-        # Create CP2112 device instance
-        i2c_device = cp2112.CP2112Device(device_path)
+        print(f"Initializing {OLED_DRIVER.upper()} display at I2C address 0x{I2C_ADDRESS:02X}...")
         
-        # Configure I2C speed (100kHz is standard for most OLED displays)
-        i2c_device.set_smbus_config(clock_speed=100000)
+        i2c_bus = open_i2c_bus(devices)
+        if i2c_bus is None:
+            return None
         
         # If using TCA9548A multiplexer, select the appropriate channel
         i2c = None
@@ -243,124 +833,463 @@ def init_display():
                 import adafruit_tca9548a
                 print(f"Using TCA9548A multiplexer at address 0x{MULTIPLEXER_ADDRESS:02X}, channel {MULTIPLEXER_CHANNEL}")
                 
-                # Create I2C bus wrapper and multiplexer
-                i2c_bus = CP2112I2CBus(i2c_device)
                 multiplexer = adafruit_tca9548a.TCA9548A(i2c_bus, address=MULTIPLEXER_ADDRESS)
                 i2c = multiplexer[MULTIPLEXER_CHANNEL]
             except ImportError:
                 print("Warning: TCA9548A support requested but library not installed", file=sys.stderr)
                 print("Install with: pip3 install adafruit-circuitpython-tca9548a", file=sys.stderr)
                 print("Continuing without multiplexer...", file=sys.stderr)
-                # Fall through to use CP2112 directly
+                # Fall through to use the bus directly
             except Exception as e:
                 print(f"Warning: Failed to initialize TCA9548A multiplexer: {e}", file=sys.stderr)
                 print("Continuing without multiplexer...", file=sys.stderr)
-                # Fall through to use CP2112 directly
+                # Fall through to use the bus directly
         
-        # If not using multiplexer or multiplexer setup failed, use CP2112 directly
+        # If not using multiplexer or multiplexer setup failed, use the bus directly
+        direct_cp2112 = i2c is None and OLED_BUS == 'cp2112'
         if i2c is None:
-            i2c = CP2112I2CBus(i2c_device)
+            i2c = i2c_bus
         
-        # Create the OLED display class based on driver selection
-        driver_module = DRIVER_MODULES[OLED_DRIVER]
-        
-        # Initialize the appropriate driver class
+        # Initialize the selected driver class
         # All drivers use the same interface: DriverName_I2C(width, height, i2c, addr)
-        driver_class_name = f"{OLED_DRIVER.upper()}_I2C"
-        driver_class = getattr(driver_module, driver_class_name)
         oled = driver_class(WIDTH, HEIGHT, i2c, addr=I2C_ADDRESS)
         
-        # Clear display
-        oled.fill(0)
-        oled.show()
+        # CP2112 bus the display is directly attached to, or None; display
+        # writes on it go out in HID-report-sized chunks
+        oled.cp2112_bus = i2c_bus if direct_cp2112 else None
+        
+        # display_info() writes frames straight into the driver's buffer:
+        # a 0x40 data control byte followed by the page-packed pixels
+        if len(getattr(oled, 'buffer', b'')) != FRAME_SIZE + 1:
+            print(f"Error: {OLED_DRIVER} driver has an unsupported framebuffer layout", file=sys.stderr)
+            return None
+        
+        bus = oled.cp2112_bus
+        if bus is not None and OLED_DRIVER not in _PAGE_ADDRESSING_DRIVERS:
+            # Send the framebuffer in HID-report-sized transfers rather than
+            # as one long write that the bridge has to split up anyway.
+            # (Page addressing drivers interleave page commands with their
+            # framebuffer writes, so they keep their own.)
+            data = memoryview(oled.buffer)[1:]
+            oled.write_framebuf = lambda: bus.writeto_fast(I2C_ADDRESS, data)
+        
+        # No clear here: the driver blanks the display while initializing
+        # it, and the first display_info() sends a full frame anyway
         
         print(f"✓ {OLED_DRIVER.upper()} display initialized successfully")
         
         return oled
     except Exception as e:
         print(f"Error initializing display: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        if OLED_BUS == 'board':
+            print("If the display does not respond, check the kernel's I2C clock:", file=sys.stderr)
+            print("  - Raspberry Pi: dtparam=i2c_arm_baudrate=400000 in config.txt", file=sys.stderr)
+            print("  - Other boards: clock-frequency of the I2C node in the device tree", file=sys.stderr)
+        if OLED_DEBUG:
+            import traceback
+            traceback.print_exc()
         return None
 
+# Classic 5x7 bitmap font for printable ASCII (0x20-0x7E). Each glyph is
+# five column bytes, least significant bit at the top, drawn in a 6x8 cell.
+_FONT_5X7 = bytes((
+    0x00, 0x00, 0x00, 0x00, 0x00,  # space
+    0x00, 0x00, 0x5F, 0x00, 0x00,  # !
+    0x00, 0x07, 0x00, 0x07, 0x00,  # "
+    0x14, 0x7F, 0x14, 0x7F, 0x14,  # #
+    0x24, 0x2A, 0x7F, 0x2A, 0x12,  # $
+    0x23, 0x13, 0x08, 0x64, 0x62,  # %
+    0x36, 0x49, 0x55, 0x22, 0x50,  # &
+    0x00, 0x05, 0x03, 0x00, 0x00,  # '
+    0x00, 0x1C, 0x22, 0x41, 0x00,  # (
+    0x00, 0x41, 0x22, 0x1C, 0x00,  # )
+    0x14, 0x08, 0x3E, 0x08, 0x14,  # *
+    0x08, 0x08, 0x3E, 0x08, 0x08,  # +
+    0x00, 0x50, 0x30, 0x00, 0x00,  # ,
+    0x08, 0x08, 0x08, 0x08, 0x08,  # -
+    0x00, 0x60, 0x60, 0x00, 0x00,  # .
+    0x20, 0x10, 0x08, 0x04, 0x02,  # /
+    0x3E, 0x51, 0x49, 0x45, 0x3E,  # 0
+    0x00, 0x42, 0x7F, 0x40, 0x00,  # 1
+    0x42, 0x61, 0x51, 0x49, 0x46,  # 2
+    0x21, 0x41, 0x45, 0x4B, 0x31,  # 3
+    0x18, 0x14, 0x12, 0x7F, 0x10,  # 4
+    0x27, 0x45, 0x45, 0x45, 0x39,  # 5
+    0x3C, 0x4A, 0x49, 0x49, 0x30,  # 6
+    0x01, 0x71, 0x09, 0x05, 0x03,  # 7
+    0x36, 0x49, 0x49, 0x49, 0x36,  # 8
+    0x06, 0x49, 0x49, 0x29, 0x1E,  # 9
+    0x00, 0x36, 0x36, 0x00, 0x00,  # :
+    0x00, 0x56, 0x36, 0x00, 0x00,  # ;
+    0x08, 0x14, 0x22, 0x41, 0x00,  # <
+    0x14, 0x14, 0x14, 0x14, 0x14,  # =
+    0x00, 0x41, 0x22, 0x14, 0x08,  # >
+    0x02, 0x01, 0x51, 0x09, 0x06,  # ?
+    0x32, 0x49, 0x79, 0x41, 0x3E,  # @
+    0x7E, 0x11, 0x11, 0x11, 0x7E,  # A
+    0x7F, 0x49, 0x49, 0x49, 0x36,  # B
+    0x3E, 0x41, 0x41, 0x41, 0x22,  # C
+    0x7F, 0x41, 0x41, 0x22, 0x1C,  # D
+    0x7F, 0x49, 0x49, 0x49, 0x41,  # E
+    0x7F, 0x09, 0x09, 0x09, 0x01,  # F
+    0x3E, 0x41, 0x49, 0x49, 0x7A,  # G
+    0x7F, 0x08, 0x08, 0x08, 0x7F,  # H
+    0x00, 0x41, 0x7F, 0x41, 0x00,  # I
+    0x20, 0x40, 0x41, 0x3F, 0x01,  # J
+    0x7F, 0x08, 0x14, 0x22, 0x41,  # K
+    0x7F, 0x40, 0x40, 0x40, 0x40,  # L
+    0x7F, 0x02, 0x0C, 0x02, 0x7F,  # M
+    0x7F, 0x04, 0x08, 0x10, 0x7F,  # N
+    0x3E, 0x41, 0x41, 0x41, 0x3E,  # O
+    0x7F, 0x09, 0x09, 0x09, 0x06,  # P
+    0x3E, 0x41, 0x51, 0x21, 0x5E,  # Q
+    0x7F, 0x09, 0x19, 0x29, 0x46,  # R
+    0x46, 0x49, 0x49, 0x49, 0x31,  # S
+    0x01, 0x01, 0x7F, 0x01, 0x01,  # T
+    0x3F, 0x40, 0x40, 0x40, 0x3F,  # U
+    0x1F, 0x20, 0x40, 0x20, 0x1F,  # V
+    0x3F, 0x40, 0x38, 0x40, 0x3F,  # W
+    0x63, 0x14, 0x08, 0x14, 0x63,  # X
+    0x07, 0x08, 0x70, 0x08, 0x07,  # Y
+    0x61, 0x51, 0x49, 0x45, 0x43,  # Z
+    0x00, 0x7F, 0x41, 0x41, 0x00,  # [
+    0x02, 0x04, 0x08, 0x10, 0x20,  # backslash
+    0x00, 0x41, 0x41, 0x7F, 0x00,  # ]
+    0x04, 0x02, 0x01, 0x02, 0x04,  # ^
+    0x40, 0x40, 0x40, 0x40, 0x40,  # _
+    0x00, 0x01, 0x02, 0x04, 0x00,  # `
+    0x20, 0x54, 0x54, 0x54, 0x78,  # a
+    0x7F, 0x48, 0x44, 0x44, 0x38,  # b
+    0x38, 0x44, 0x44, 0x44, 0x20,  # c
+    0x38, 0x44, 0x44, 0x48, 0x7F,  # d
+    0x38, 0x54, 0x54, 0x54, 0x18,  # e
+    0x08, 0x7E, 0x09, 0x01, 0x02,  # f
+    0x0C, 0x52, 0x52, 0x52, 0x3E,  # g
+    0x7F, 0x08, 0x04, 0x04, 0x78,  # h
+    0x00, 0x44, 0x7D, 0x40, 0x00,  # i
+    0x20, 0x40, 0x44, 0x3D, 0x00,  # j
+    0x7F, 0x10, 0x28, 0x44, 0x00,  # k
+    0x00, 0x41, 0x7F, 0x40, 0x00,  # l
+    0x7C, 0x04, 0x18, 0x04, 0x78,  # m
+    0x7C, 0x08, 0x04, 0x04, 0x78,  # n
+    0x38, 0x44, 0x44, 0x44, 0x38,  # o
+    0x7C, 0x14, 0x14, 0x14, 0x08,  # p
+    0x08, 0x14, 0x14, 0x18, 0x7C,  # q
+    0x7C, 0x08, 0x04, 0x04, 0x08,  # r
+    0x48, 0x54, 0x54, 0x54, 0x20,  # s
+    0x04, 0x3F, 0x44, 0x40, 0x20,  # t
+    0x3C, 0x40, 0x40, 0x20, 0x7C,  # u
+    0x1C, 0x20, 0x40, 0x20, 0x1C,  # v
+    0x3C, 0x40, 0x30, 0x40, 0x3C,  # w
+    0x44, 0x28, 0x10, 0x28, 0x44,  # x
+    0x0C, 0x50, 0x50, 0x50, 0x3C,  # y
+    0x44, 0x64, 0x54, 0x4C, 0x44,  # z
+    0x00, 0x08, 0x36, 0x41, 0x00,  # {
+    0x00, 0x00, 0x7F, 0x00, 0x00,  # |
+    0x00, 0x41, 0x36, 0x08, 0x00,  # }
+    0x08, 0x04, 0x08, 0x10, 0x08,  # ~
+))
+
+# Horizontal advance per character, including one blank spacing column
+_CHAR_WIDTH = 6
+
+def _draw_text(fb, x, y, text):
+    """Draw text into a framebuffer with the built-in 5x7 font.
+    
+    The framebuffer uses the page layout of the OLED controllers (and
+    the Adafruit drivers' buffer): byte ``page * WIDTH + x`` holds the
+    8 pixels of column x from y = page * 8 down, top pixel in bit 0.
+    Glyphs not aligned to a page are split over two pages. Characters
+    outside printable ASCII are drawn as '?', and text is clipped at the
+    right edge.
+    
+    Args:
+        fb: Writable framebuffer of FRAME_SIZE bytes.
+        x: Left edge of the text in pixels.
+        y: Top edge of the text in pixels.
+        text: String to draw.
+    """
+    page, shift = divmod(y, 8)
+    top = page * WIDTH
+    # Row of the page below, if any, for glyphs straddling two pages
+    bottom = top + WIDTH if shift and page + 1 < PAGES else None
+    for ch in text:
+        if x + 5 > WIDTH:
+            break
+        code = ord(ch) - 32
+        if not 0 <= code < 95:
+            code = ord('?') - 32
+        glyph = _FONT_5X7[code * 5:code * 5 + 5]
+        if not shift:
+            fb[top + x:top + x + 5] = glyph
+        else:
+            for i, column in enumerate(glyph):
+                fb[top + x + i] |= (column << shift) & 0xFF
+                if bottom is not None:
+                    fb[bottom + x + i] |= column >> (8 - shift)
+        x += _CHAR_WIDTH
+
+def _render_template():
+    """Draw the static parts of the status screen.
+    
+    Returns:
+        bytes: Framebuffer with header, separator and field labels.
+    """
+    fb = bytearray(FRAME_SIZE)
+    
+    # Draw header
+    _draw_text(fb, 0, 0, "X11 Stream")
+    # Separator line across row 10 (page 1, bit 2)
+    fb[WIDTH:2 * WIDTH] = bytes((1 << 2,)) * WIDTH
+    
+    # Draw field labels
+    _draw_text(fb, 0, 15, "IP:")
+    _draw_text(fb, 0, 42, "Status:")
+    return bytes(fb)
+
+# Static screen, drawn once and copied for each update
+_TEMPLATE = _render_template()
+
+@functools.lru_cache(maxsize=32)
+def _render_rows(y, text):
+    """Draw text over the static screen and cut out the pages it covers.
+    
+    Results are cached per string, so a value already shown once (a
+    status, a recent IP address) is copied in instead of drawn again.
+    Fields drawn this way must not share pages with each other.
+    
+    Args:
+        y: Top edge of the text in pixels.
+        text: String to draw.
+    
+    Returns:
+        tuple: (offset, bytes) of those pages within the framebuffer.
+    """
+    fb = bytearray(_TEMPLATE)
+    _draw_text(fb, 0, y, text)
+    first = y // 8
+    last = min((y + 7) // 8, PAGES - 1)
+    return first * WIDTH, bytes(fb[first * WIDTH:(last + 1) * WIDTH])
+
+# Pre-render the status row (pages 6-7) for every status
+# get_stream_status() can return
+for _status in ("Streaming", "Stopped", "Unknown"):
+    _render_rows(54, _status)
+del _status
+
+# Framebuffer last sent to the display
+_LAST_FRAME = {"bytes": None}
+
+def _dirty_page_runs(frame, previous):
+    """Find the pages that differ between two frames.
+    
+    Args:
+        frame: New framebuffer.
+        previous: Framebuffer currently on the display.
+    
+    Returns:
+        list: (first_page, last_page) tuples of consecutive changed pages.
+    """
+    runs = []
+    for page in range(PAGES):
+        start = page * WIDTH
+        if frame[start:start + WIDTH] == previous[start:start + WIDTH]:
+            continue
+        if runs and runs[-1][1] == page - 1:
+            runs[-1] = (runs[-1][0], page)
+        else:
+            runs.append((page, page))
+    return runs
+
+def show_region(oled, page_start, page_end):
+    """Send only some pages of the driver's buffer to the display.
+    
+    oled.show() always transfers the whole 1 KiB frame. This sets the
+    controller's write window to the given pages and sends just their
+    bytes, with the commands and data in a single I2C transfer: each
+    command behind a 0x80 control byte, then the data behind 0x40.
+    SH1106 has no window commands, so each page is sent on its own
+    after setting the page and column start.
+    
+    Args:
+        oled: Display from init_display().
+        page_start: First page to send (0-7).
+        page_end: Last page to send, inclusive.
+    """
+    buffer = memoryview(oled.buffer)
+    if OLED_DRIVER in _PAGE_ADDRESSING_DRIVERS:
+        column_start = getattr(oled, 'page_column_start', None) or _SH1106_COLUMN_START
+        transfers = [
+            ((0xB0 | page, *column_start), buffer[1 + page * WIDTH:1 + (page + 1) * WIDTH])
+            for page in range(page_start, page_end + 1)
+        ]
+    else:
+        # SSD1305 modules map the visible area at a column offset
+        column = getattr(oled, '_column_offset', 0)
+        commands = (0x21, column, column + WIDTH - 1, 0x22, page_start, page_end)
+        transfers = [(commands, buffer[1 + page_start * WIDTH:1 + (page_end + 1) * WIDTH])]
+    
+    bus = oled.cp2112_bus
+    if bus is not None:
+        for commands, data in transfers:
+            # Commands as one command stream, then the data one report at a time
+            bus.writeto_cmd_then_data(I2C_ADDRESS, commands)
+            bus.writeto_fast(I2C_ADDRESS, data)
+        return
+    
+    with oled.i2c_device as device:
+        for commands, data in transfers:
+            device.write(command_data_frame(commands, data))
+
 def display_info(oled, ip_address, status):
     """Display IP address and status on the OLED."""
     try:
-        # Create blank image for drawing
-        image = Image.new("1", (WIDTH, HEIGHT))
-        draw = ImageDraw.Draw(image)
-        
-        # Use default font
-        font = ImageFont.load_default()
-        
-        # Draw header
-        draw.text((0, 0), "X11 Stream", font=font, fill=255)
-        draw.line((0, 10, WIDTH, 10), fill=255)
+        # Start from the pre-rendered static screen
+        fb = bytearray(_TEMPLATE)
         
-        # Draw IP address
-        draw.text((0, 15), "IP:", font=font, fill=255)
-        draw.text((0, 27), ip_address, font=font, fill=255)
+        # Copy in the dynamic values (IP on pages 3-4, status on 6-7)
+        for y, text in ((27, ip_address), (54, status)):
+            offset, data = _render_rows(y, text)
+            fb[offset:offset + len(data)] = data
         
-        # Draw status
-        draw.text((0, 42), "Status:", font=font, fill=255)
-        draw.text((0, 54), status, font=font, fill=255)
+        # Skip the I2C transfer if the screen would not change
+        previous = _LAST_FRAME["bytes"]
+        if fb == previous:
+            return
         
-        # Display image
-        oled.image(image)
-        oled.show()
+        # Copy straight into the driver's buffer, after its 0x40 data
+        # control byte, instead of converting a PIL image with oled.image()
+        oled.buffer[1:] = fb
+        # Until a frame is known to be on the display, send all of it
+        _LAST_FRAME["bytes"] = None
+        if previous is None:
+            oled.show()
+        else:
+            # Only the IP and status rows change between updates
+            for page_start, page_end in _dirty_page_runs(fb, previous):
+                show_region(oled, page_start, page_end)
+        _LAST_FRAME["bytes"] = bytes(fb)
+        _clear_warning("display")
     except Exception as e:
-        print(f"Error displaying info: {e}", file=sys.stderr)
+        _warn("display", f"Error displaying info: {e}")
+
+def _publish(updates, update):
+    """Queue an update for the display thread, replacing any pending one.
+    
+    Args:
+        updates: Display thread's queue (maxsize 1).
+        update: (ip_address, status) tuple, or None to wake the thread.
+    """
+    while True:
+        try:
+            updates.put_nowait(update)
+            return
+        except queue.Full:
+            # The display thread is busy: the newer values win
+            try:
+                updates.get_nowait()
+            except queue.Empty:
+                pass
+
+def _display_worker(oled, updates, stop):
+    """Draw queued updates until stop is set.
+    
+    Runs in its own thread so a slow I2C transfer never delays polling.
+    
+    Args:
+        oled: Display from init_display().
+        updates: Queue of (ip_address, status) tuples from the main loop.
+        stop: Event set on shutdown (followed by a None update to wake
+            the thread).
+    """
+    while True:
+        update = updates.get()
+        if stop.is_set():
+            return
+        display_info(oled, *update)
 
 def main():
     """Main loop to update display information."""
     print("Initializing OLED display...")
     
     # Perform I2C auto-check
-    if not check_i2c_available():
+    devices = check_i2c_available()
+    if not devices:
         print("I2C auto-check failed. Cannot continue.", file=sys.stderr)
         sys.exit(1)
     
     print()  # Add blank line for readability
     
     # Initialize display
-    oled = init_display()
+    oled = init_display(devices)
     if oled is None:
         print("Failed to initialize display. Exiting.", file=sys.stderr)
         sys.exit(1)
     
     print("OLED display initialized successfully")
+    
+    if connect_systemd():
+        print("Watching stream status changes from systemd over D-Bus")
+    if watch_network():
+        print("Watching network address changes over netlink")
+    
     print("Displaying IP address and stream status...")
     
+    # The display is drawn by its own thread; the main loop only polls
+    updates = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    display_thread = threading.Thread(
+        target=_display_worker,
+        args=(oled, updates, stop),
+        name="display",
+        daemon=True
+    )
+    display_thread.start()
+    
     # Cache previous values to avoid unnecessary updates
     previous_ip = None
     previous_status = None
     
-    # Retry configuration for transient errors
+    # Retry configuration for transient errors; the delay doubles after
+    # each consecutive failure, up to max_retry_delay
     max_retries = 3
     retry_delay = 5  # seconds
+    max_retry_delay = 60  # seconds
     consecutive_errors = 0
     
-    # Main loop
+    # Main loop, scheduled on a monotonic deadline so the time spent
+    # updating does not stretch the polling period
+    next_update = time.monotonic()
     try:
         while True:
             try:
                 # Get current information
                 ip_address = get_local_ip()
                 status = get_stream_status()
+                # Reset error counter on a successful poll
+                consecutive_errors = 0
                 
                 # Only update display when IP address or status has changed
                 if ip_address != previous_ip or status != previous_status:
-                    display_info(oled, ip_address, status)
+                    _publish(updates, (ip_address, status))
                     previous_ip = ip_address
                     previous_status = status
-                    # Reset error counter on successful update
-                    consecutive_errors = 0
                 
-                # Wait before next update (update every 5 seconds)
-                time.sleep(5)
+                # Wait for a change or the next poll; status changes are
+                # pushed over D-Bus (and address changes over netlink), so
+                # only poll slowly then
+                if _SYSTEMD["watching"]:
+                    next_update += EVENT_POLL_INTERVAL
+                else:
+                    next_update += POLL_INTERVAL
+                next_update = max(next_update, time.monotonic())
+                if wait_for_change(next_update):
+                    # Update now and restart the polling schedule from here
+                    next_update = time.monotonic()
                 
-            except Exception as e:
-                # Handle transient I2C errors with retry logic
+            except OSError as e:
+                # Handle transient OS errors with retry logic; anything else
+                # is a bug, so it goes straight to the fatal error handler
                 consecutive_errors += 1
                 print(f"Error in display update (attempt {consecutive_errors}/{max_retries}): {e}", file=sys.stderr)
                 
@@ -368,12 +1297,22 @@ def main():
                     print(f"Maximum retry attempts ({max_retries}) reached. Exiting.", file=sys.stderr)
                     raise
                 
-                # Wait before retrying
-                print(f"Retrying in {retry_delay} seconds...", file=sys.stderr)
-                time.sleep(retry_delay)
+                # Wait before retrying, backing off exponentially
+                delay = min(retry_delay * 2 ** (consecutive_errors - 1), max_retry_delay)
+                print(f"Retrying in {delay} seconds...", file=sys.stderr)
+                time.sleep(delay)
+                next_update = time.monotonic()
     
     except KeyboardInterrupt:
         print("\nShutting down OLED display...")
+        # Let the display thread finish its current frame first
+        stop.set()
+        _publish(updates, None)
+        display_thread.join(timeout=2)
+        if display_thread.is_alive():
+            # Its transfer is stuck; don't drive the bus from two threads
+            print("Warning: Display update still in progress, not clearing display", file=sys.stderr)
+            sys.exit(0)
         # Clear display on exit
         try:
             oled.fill(0)
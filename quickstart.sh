@@ -201,7 +201,7 @@ if [[ "$install_oled" =~ ^[Yy]$ ]]; then
     print_info "Installing Python dependencies for OLED display..."
     
     # Install CP2112 and base dependencies
-    pip3 install --user cp2112 Pillow
+    pip3 install --user cp2112 Pillow jeepney
     
     # Install driver-specific libraries
     if [ "$OLED_DRIVER" = "all" ]; then